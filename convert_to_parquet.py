@@ -0,0 +1,53 @@
+"""One-shot conversion of the claims CSV into the typed Parquet file read by the dashboard.
+
+Run again whenever healthcare_fraud_claims_clean.csv changes:
+
+    python convert_to_parquet.py
+"""
+import pandas as pd
+
+CSV_PATH = 'healthcare_fraud_claims_clean.csv'
+PARQUET_PATH = 'healthcare_fraud_claims_clean.parquet'
+
+# Explicit CSV dtypes skip read_csv's type inference; small counters are read straight
+# into the narrowest integer that fits, and dates stay strings until parsed below
+CSV_DTYPES = {
+    'Provider': 'str',
+    'PotentialFraud': 'str',
+    'ClaimType': 'str',
+    'ClaimID': 'str',
+    'InscClaimAmtReimbursed': 'int32',
+    'AttendingDate': 'str',
+    'ClaimEndDate': 'str',
+    'ClaimYear': 'int16',
+    'LengthOfStay': 'int8',
+    'ChronicConditionCount': 'int8',
+    'ChronicConditionList': 'str',
+    'Gender': 'int8',
+    'Race': 'int8',
+}
+
+
+def convert(csv_path=CSV_PATH, parquet_path=PARQUET_PATH):
+    df = pd.read_csv(csv_path, usecols=list(CSV_DTYPES), dtype=CSV_DTYPES)
+
+    # Dates are stored as DD/MM/YYYY in the CSV
+    df['AttendingDate'] = pd.to_datetime(df['AttendingDate'], dayfirst=True, errors='coerce')
+    df['ClaimEndDate'] = pd.to_datetime(df['ClaimEndDate'], dayfirst=True, errors='coerce')
+
+    # Decode demographic codes into labels; the 1-based codes index straight into the categories
+    df['Gender'] = pd.Categorical.from_codes(df['Gender'] - 1, categories=['Male', 'Female'])
+    df['Race'] = pd.Categorical.from_codes(
+        df['Race'] - 1, categories=['White', 'Black', 'Asian', 'Hispanic', 'Other']
+    )
+
+    # Low-cardinality labels are stored dictionary-encoded and read back as categoricals
+    for col in ['Provider', 'ClaimType', 'PotentialFraud']:
+        df[col] = df[col].astype('category')
+
+    df.to_parquet(parquet_path, engine='pyarrow', index=False)
+    return df
+
+
+if __name__ == '__main__':
+    convert()
@@ -1,5 +1,8 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -12,186 +15,124 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-st.markdown("""
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700&display=swap');
-
-* {
-    font-family: 'Poppins', sans-serif;
-}
-
-/* MAIN BACKGROUND */
-.main {
-    background-color: #f5f5f7;
-}
-
-/* SIDEBAR */
-[data-testid="stSidebar"] {
-    background-color: #722f37 !important;
-}
-
-/* SIDEBAR TEXT VISIBILITY */
-[data-testid="stSidebar"] * {
-    color: #ffffff !important;
-}
-
-/* SIDEBAR HEADERS */
-[data-testid="stSidebar"] h1,
-[data-testid="stSidebar"] h2,
-[data-testid="stSidebar"] h3,
-[data-testid="stSidebar"] label {
-    font-weight: 600;
-    color: #ffffff !important;
-}
-
-/* SIDEBAR INPUTS – UNIFIED STYLE */
-[data-testid="stSidebar"] .stSelectbox > div,
-[data-testid="stSidebar"] .stMultiselect > div,
-[data-testid="stSidebar"] .stDateInput > div {
-    background-color: rgba(255,255,255,0.15) !important;
-    border-radius: 8px !important;
-    border: 1px solid rgba(255,255,255,0.3) !important;
-}
-
-/* SELECTED VALUE */
-[data-testid="stSidebar"] div[data-baseweb="select"] {
-    background-color: rgba(255,255,255,0.15) !important;
-    color: #ffffff !important;
-}
-
-/* DROPDOWN MENU */
-[data-baseweb="popover"] {
-    background-color: #ffffff !important;
-    color: #333333 !important;
-}
-
-/* METRIC CARDS */
-.metric-card {
-    background: #ffffff;
-    padding: 20px;
-    border-radius: 12px;
-    border-left: 5px solid #722f37;
-    box-shadow: 0 4px 6px rgba(0,0,0,0.05);
-    margin-bottom: 20px;
-}
-
-/* HEADERS */
-.main-header {
-    font-size: 2.6rem;
-    font-weight: 700;
-    text-align: center;
-    color: #ffffff;
-    padding: 20px;
-    background: #722f37;
-    border-radius: 15px;
-    box-shadow: 0 4px 6px rgba(0,0,0,0.05);
-}
-
-.sub-header {
-    font-size: 1.6rem;
-    font-weight: 600;
-    color: #722f37;
-    border-bottom: 3px solid #722f37;
-    padding-bottom: 10px;
-    margin-bottom: 20px;
-}
-
-/* PLOTLY CONTAINER FIXES */
-/* Adds spacing around charts to prevent overlap */
-.stPlotlyChart {
-    margin-bottom: 20px;
-    background-color: #ffffff;
-    border-radius: 12px;
-    padding: 10px;
-    box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-}
-
-.js-plotly-plot,
-.plot-container {
-    border-radius: 12px;
-}
-
-/* NAVIGATION TABS STYLING */
-.stTabs [data-baseweb="tab-list"] {
-    gap: 8px;
-}
-
-.stTabs [data-baseweb="tab"] {
-    background-color: #f0f0f0;
-    border-radius: 8px 8px 0 0;
-    padding: 10px 20px;
-    font-weight: 500;
-    color: #722f37;
-    border: 1px solid #e0e0e0;
-}
-
-.stTabs [data-baseweb="tab"][aria-selected="true"] {
-    background-color: #333333 !important;
-    color: #ffffff !important;
-    font-weight: 600;
-}
-
-/* GRAPH INSIGHTS CONTAINER */
-.graph-insights {
-    background-color: #f8f9fa;
-    border-left: 4px solid #722f37;
-    padding: 15px;
-    margin-top: 15px; /* Added spacing to separate from graph */
-    margin-bottom: 25px; /* Added spacing below the block */
-    border-radius: 0 8px 8px 0;
-    font-size: 0.95rem;
-    color: #000000; /* Force black text */
-    box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-}
-
-.graph-insights h4 {
-    color: #722f37;
-    margin-top: 0;
-    margin-bottom: 10px;
-    font-size: 1.1rem;
-    font-weight: 600;
-}
-
-/* KEY INSIGHTS SIDEBAR HEADER */
-.key-insights-header {
-    font-size: 1.4rem;
-    font-weight: 700;
-    color: #ffffff;
-    text-align: center;
-    padding: 10px;
-    background: rgba(255,255,255,0.1);
-    border-radius: 8px;
-    margin-bottom: 20px;
-    border: 2px solid rgba(255,255,255,0.2);
-}
-</style>
-""", unsafe_allow_html=True)
-
-@st.cache_data
+@st.cache_resource(show_spinner=False)
+def load_css(path='style.css'):
+    """Dashboard stylesheet, read from disk once per server process"""
+    with open(path) as f:
+        return f'<style>{f.read()}</style>'
+
+# Re-emitted every rerun; only the file read is cached
+st.html(load_css())
+
+# Columns the dashboard reads; the rest of the Parquet file (ClaimID, ClaimEndDate) is never loaded
+USECOLS = [
+    'Provider', 'PotentialFraud', 'ClaimType', 'InscClaimAmtReimbursed',
+    'AttendingDate', 'ClaimYear', 'LengthOfStay', 'ChronicConditionCount',
+    'ChronicConditionList', 'Gender', 'Race'
+]
+
+@st.cache_data(show_spinner=False)
 def load_data():
-    # Load the CSV file
-    df = pd.read_csv('healthcare_fraud_claims_clean.csv')
+    # Load the typed Parquet file (see convert_to_parquet.py); only the columns the dashboard uses
+    df = pd.read_parquet('healthcare_fraud_claims_clean.parquet', engine='pyarrow', columns=USECOLS)
     
-    # Convert date columns with dayfirst=True for DD/MM/YYYY format
-    df['AttendingDate'] = pd.to_datetime(df['AttendingDate'], dayfirst=True, errors='coerce')
-    df['ClaimEndDate'] = pd.to_datetime(df['ClaimEndDate'], dayfirst=True, errors='coerce')
+    # Keep the condition lists Arrow-backed whatever the pandas default string dtype, so
+    # split_conditions hands their buffer to pyarrow.compute without a copy
+    df['ChronicConditionList'] = df['ChronicConditionList'].astype('string[pyarrow]')
     
-    # Calculate claim duration (using the now-corrected dates)
-    df['ClaimDuration'] = (df['ClaimEndDate'] - df['AttendingDate']).dt.days + 1
+    # The bincount aggregations index groups by category code, which is -1 for a missing label
+    missing = [col for col in ['Provider', 'ClaimType', 'PotentialFraud'] if df[col].isna().any()]
+    if missing:
+        raise ValueError(f"Missing labels in {', '.join(missing)}; regenerate the Parquet file from a complete CSV")
     
-    # Convert Gender to categorical
-    df['Gender'] = df['Gender'].map({1: 'Male', 2: 'Female'})
+    # Filter-independent derived columns, computed once per session
+    df['_is_fraud'] = (df['PotentialFraud'] == 'Yes').astype('int8')
     
-    # Convert Race to categorical (simplified)
-    df['Race'] = df['Race'].map({1: 'White', 2: 'Black', 3: 'Asian', 4: 'Hispanic', 5: 'Other'})
+    # Frequency of each individual chronic condition across the dataset
+    conditions, _ = split_conditions(df['ChronicConditionList'])
+    condition_counts = pd.Series(conditions).value_counts().astype('int64')
     
-    # Process ChronicConditionList to extract individual conditions
-    all_conditions = []
-    for condition_list in df['ChronicConditionList'].dropna():
-        conditions = condition_list.split(',')
-        all_conditions.extend([cond.strip() for cond in conditions])
+    # Sidebar option lists only depend on the full dataset
+    claim_types = df['ClaimType'].unique().tolist()
     
-    return df, all_conditions
+    return df, condition_counts, claim_types
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def providers_for_range(_df, start_date, end_date):
+    """Sorted providers with at least one claim in the date range (None means the full range)"""
+    providers = _df['Provider']
+    if start_date is not None:
+        providers = providers[(_df['AttendingDate'] >= start_date) & (_df['AttendingDate'] <= end_date)]
+    return sorted(providers.unique().tolist())
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def apply_filters(_df, start_date, end_date, provider, statuses, claim_types):
+    """Return the claims matching the sidebar selections; None (or empty claim types) means no filter.
+
+    Cached as a resource keyed on the selections so hits hand back the shared frame
+    without a copy; callers must not mutate the result.
+    """
+    # One boolean buffer updated in place; categorical columns are matched on their integer codes
+    mask = np.ones(len(_df), dtype=bool)
+    if start_date is not None:
+        dates = _df['AttendingDate'].to_numpy()
+        mask &= dates >= start_date.asm8
+        mask &= dates <= end_date.asm8
+    if provider is not None:
+        mask &= category_codes_isin(_df['Provider'], [provider])
+    if statuses is not None:
+        mask &= category_codes_isin(_df['PotentialFraud'], statuses)
+    if claim_types:
+        mask &= category_codes_isin(_df['ClaimType'], claim_types)
+    return _df.loc[mask]
+
+def category_codes_isin(series, values):
+    """Boolean array marking rows of a categorical Series whose label is in values"""
+    codes = series.cat.categories.get_indexer(list(values))
+    return np.isin(series.cat.codes.to_numpy(), codes[codes >= 0])
+
+def sample_by_fraud_status(df, max_points=5000):
+    """Stratified sample of about max_points rows keeping each fraud status's share, used to keep scatter payloads small"""
+    if len(df) <= max_points:
+        return df
+    rng = np.random.default_rng(0)
+    codes = df['PotentialFraud'].cat.codes.to_numpy()
+    keep = []
+    for code in np.unique(codes):
+        idx = np.flatnonzero(codes == code)
+        # Each class gets rows in proportion to its size, at least one so no status disappears
+        n_rows = max(1, round(max_points * idx.size / len(df)))
+        keep.append(rng.choice(idx, n_rows, replace=False))
+    return df.iloc[np.sort(np.concatenate(keep))]
+
+def group_totals(codes, n_groups, **columns):
+    """Row count and per-column sums for each integer group code, one np.bincount pass each"""
+    counts = np.bincount(codes, minlength=n_groups)
+    sums = {name: np.bincount(codes, weights=values, minlength=n_groups) for name, values in columns.items()}
+    return counts, sums
+
+def fraud_status_lines(data, x, y, mode='lines'):
+    """One spline go.Scatter trace per fraud status, coloured like the px charts"""
+    fig = go.Figure()
+    for status, group in data.groupby('PotentialFraud', observed=True):
+        fig.add_trace(go.Scatter(
+            x=group[x].to_numpy(),
+            y=group[y].to_numpy(),
+            mode=mode,
+            name=status,
+            legendgroup=status,
+            line=dict(color='#e74c3c' if status == 'Yes' else '#2ecc71', shape='spline'),
+            hovertemplate=f'PotentialFraud={status}<br>{x}=%{{x}}<br>{y}=%{{y}}<extra></extra>'
+        ))
+    fig.update_layout(legend_title_text='PotentialFraud')
+    return fig
+
+def split_conditions(condition_lists):
+    """Every listed condition, stripped and flattened, plus the number each claim lists (0 if missing)"""
+    # split/flatten/strip run as one pyarrow.compute pass over the Arrow string buffer
+    lists = pc.split_pattern(pa.array(condition_lists), ',')
+    conditions = pd.arrays.ArrowExtensionArray(pc.utf8_trim_whitespace(pc.list_flatten(lists)))
+    return conditions, pc.list_value_length(lists).fill_null(0).to_numpy()
 
 def add_graph_insights(title, insights):
     """Helper function to add insights below graphs"""
@@ -222,13 +163,376 @@ def update_chart_layout(fig, title_text):
     fig.update_yaxes(title_font=dict(color='black'), tickfont=dict(color='black'), showgrid=True, gridcolor='#eee')
     return fig
 
+# Builders are keyed on the filter tuple; caches are bounded.
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_fraud_distribution(filters, _df):
+    """Fraud vs non-fraud pie chart"""
+    fraud_dist = _df['PotentialFraud'].value_counts()
+    fraud_dist = fraud_dist[fraud_dist > 0].astype('int32')
+    colors = ['#e74c3c' if x == 'Yes' else '#2ecc71' for x in fraud_dist.index]
+    
+    fig1 = go.Figure(data=[go.Pie(
+        labels=['Potential Fraud' if x == 'Yes' else 'No Fraud' for x in fraud_dist.index],
+        values=fraud_dist.values,
+        hole=0.3,
+        marker_colors=colors,
+        textinfo='percent+label',
+        textfont=dict(family='Poppins', size=14, color='black')
+    )])
+    return update_chart_layout(fig1, 'Fraud Distribution Analysis')
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_claim_type_distribution(filters, _df):
+    """Claim count per claim type; returns the figure and the counts"""
+    claim_dist = _df['ClaimType'].value_counts()
+    claim_dist = claim_dist[claim_dist > 0].astype('int32')
+    fig2 = go.Figure(go.Bar(
+        x=claim_dist.index.to_numpy(),
+        y=claim_dist.values,
+        marker=dict(color=claim_dist.values, colorscale=['#f8d7da', '#dc3545', '#722f37'], showscale=True),
+        showlegend=False,
+        hovertemplate='Claim Type=%{x}<br>Number of Claims=%{y}<extra></extra>'
+    ))
+    fig2 = update_chart_layout(fig2, "Claim Type Distribution")
+    fig2.update_layout(xaxis_title="Claim Type", yaxis_title="Number of Claims")
+    fig2.update_xaxes(tickangle=45)
+    return fig2, claim_dist
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_gender_distribution(filters, _df):
+    """Gender pie chart; returns the figure and the counts"""
+    gender_dist = _df['Gender'].value_counts()
+    gender_dist = gender_dist[gender_dist > 0].astype('int32')
+    fig3 = go.Figure(go.Pie(
+        labels=gender_dist.index.to_numpy(),
+        values=gender_dist.values,
+        marker_colors=['#722f37', '#f8d7da']
+    ))
+    return update_chart_layout(fig3, "Gender Distribution"), gender_dist
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_race_distribution(filters, _df):
+    """Race bar chart; returns the figure and the counts"""
+    race_dist = _df['Race'].value_counts()
+    race_dist = race_dist[race_dist > 0].astype('int32')
+    fig4 = go.Figure(go.Bar(
+        x=race_dist.index.to_numpy(),
+        y=race_dist.values,
+        marker=dict(color=race_dist.values, colorscale=['#f8d7da', '#722f37'], showscale=True),
+        showlegend=False,
+        hovertemplate='Race=%{x}<br>Count=%{y}<extra></extra>'
+    ))
+    fig4 = update_chart_layout(fig4, "Race Distribution")
+    fig4.update_layout(xaxis_title="Race", yaxis_title="Count")
+    return fig4, race_dist
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def build_claim_amount_box(filters, _df):
+    """Claim amount distribution by claim type and fraud status"""
+    fig5 = px.box(
+        _df[['ClaimType', 'InscClaimAmtReimbursed', 'PotentialFraud']],
+        x='ClaimType',
+        y='InscClaimAmtReimbursed',
+        color='PotentialFraud',
+        labels={'InscClaimAmtReimbursed': 'Claim Amount ($)', 'ClaimType': 'Claim Type'},
+        color_discrete_map={'Yes': '#e74c3c', 'No': '#2ecc71'}
+    )
+    return update_chart_layout(fig5, "Claim Amount Distribution by Type")
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_provider_avg_claim(filters, _df):
+    """Top 15 provider/fraud-status pairs by average claim; returns the figure and the plotted rows"""
+    provider_avg = _df.groupby(['Provider', 'PotentialFraud'], observed=True)['InscClaimAmtReimbursed'].mean().reset_index()
+    provider_avg = provider_avg.sort_values('InscClaimAmtReimbursed', ascending=False).head(15)
+    provider_avg['InscClaimAmtReimbursed'] = provider_avg['InscClaimAmtReimbursed'].astype('float32')
+    
+    fig6 = px.bar(
+        provider_avg,
+        y='Provider',
+        x='InscClaimAmtReimbursed',
+        color='PotentialFraud',
+        labels={'InscClaimAmtReimbursed': 'Average Claim Amount ($)', 'Provider': 'Provider'},
+        orientation='h',
+        color_discrete_map={'Yes': '#e74c3c', 'No': '#2ecc71'}
+    )
+    fig6 = update_chart_layout(fig6, "Top 15 Providers by Avg Claim Amount")
+    fig6.update_layout(yaxis={'categoryorder': 'total ascending'})
+    return fig6, provider_avg
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_stay_vs_amount(filters, _inpatient_data):
+    """Length of stay vs claim amount scatter for inpatient claims"""
+    fig7 = px.scatter(
+        sample_by_fraud_status(_inpatient_data)[['LengthOfStay', 'InscClaimAmtReimbursed', 'PotentialFraud']],
+        x='LengthOfStay',
+        y='InscClaimAmtReimbursed',
+        color='PotentialFraud',
+        labels={'LengthOfStay': 'Length of Stay (days)', 'InscClaimAmtReimbursed': 'Claim Amount ($)'},
+        opacity=0.7,
+        color_discrete_map={'Yes': '#e74c3c', 'No': '#2ecc71'},
+        size_max=15,
+        render_mode='webgl'
+    )
+    fig7 = update_chart_layout(fig7, "Length of Stay vs Claim Amount (Inpatient)")
+    fig7.update_traces(marker=dict(size=8))
+    return fig7
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_provider_claim_mix(filters, _df):
+    """Stacked claim types for the 10 providers with the most claims"""
+    # Provider x claim type crosstab counted from the combined categorical codes
+    providers = _df['Provider'].cat
+    claim_types = _df['ClaimType'].cat
+    n_types = len(claim_types.categories)
+    pair_codes = providers.codes.to_numpy().astype(np.intp) * n_types + claim_types.codes.to_numpy()
+    counts, _ = group_totals(pair_codes, len(providers.categories) * n_types)
+    claim_type_by_provider = pd.DataFrame(
+        counts.reshape(-1, n_types),
+        index=pd.Index(providers.categories, name='Provider'),
+        columns=pd.Index(claim_types.categories, name='ClaimType')
+    )
+    claim_type_by_provider = claim_type_by_provider.loc[
+        claim_type_by_provider.sum(axis=1) > 0, claim_type_by_provider.sum(axis=0) > 0
+    ]
+    claim_type_by_provider['Total'] = claim_type_by_provider.sum(axis=1)
+    top_providers = claim_type_by_provider.nlargest(10, 'Total').drop('Total', axis=1).astype('int32')
+    
+    fig8 = px.bar(
+        top_providers.reset_index().melt(id_vars='Provider', var_name='ClaimType', value_name='Count'),
+        x='Provider',
+        y='Count',
+        color='ClaimType',
+        title="Claim Type Distribution by Provider (Top 10)",
+        barmode='stack',
+        color_discrete_sequence=['#722f37', '#e74c3c', '#2ecc71']
+    )
+    fig8 = update_chart_layout(fig8, "Claim Type Distribution by Provider (Top 10)")
+    fig8.update_layout(xaxis={'categoryorder': 'total descending'})
+    return fig8
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def compute_provider_stats(filters, _df):
+    """Per-provider fraud rate and claim statistics, highest fraud rate first"""
+    # Counts and sums per provider code; means are derived from them for providers with claims
+    providers = _df['Provider'].cat
+    counts, sums = group_totals(
+        providers.codes.to_numpy(),
+        len(providers.categories),
+        fraud=_df['_is_fraud'].to_numpy(),
+        amount=_df['InscClaimAmtReimbursed'].to_numpy(),
+        los=_df['LengthOfStay'].to_numpy()
+    )
+    seen = counts > 0
+    counts = counts[seen]
+    provider_stats = pd.DataFrame({
+        'Fraud_Rate_%': sums['fraud'][seen] / counts * 100,
+        'Avg_Claim_$': sums['amount'][seen] / counts,
+        'Total_Claims_$': sums['amount'][seen].astype('int64'),
+        'Claim_Count': counts,
+        'Avg_LOS_days': sums['los'][seen] / counts
+    }, index=pd.Index(providers.categories[seen], name='Provider')).round(2)
+    
+    return provider_stats.sort_values('Fraud_Rate_%', ascending=False)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_claims_over_time(filters, _df):
+    """Yearly claim volume by fraud status; returns the figure and the yearly counts"""
+    claims_over_time = _df.groupby(['ClaimYear', 'PotentialFraud'], observed=True).size().astype('int32').reset_index(name='Count')
+    
+    fig9 = fraud_status_lines(claims_over_time, 'ClaimYear', 'Count', mode='lines+markers')
+    fig9 = update_chart_layout(fig9, "Claim Volume Over Time")
+    fig9.update_layout(xaxis_title="Year", yaxis_title="Number of Claims")
+    return fig9, claims_over_time
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_monthly_trends(filters, _df):
+    """Monthly claim amount and claim volume figures, built from one aggregation"""
+    # Month-start bins straight off the datetime column, counted per (month, fraud status) code;
+    # Plotly draws the datetime axis natively
+    months = _df['AttendingDate'].to_numpy().astype('datetime64[M]')
+    # Claims without a parseable attending date (NaT) fall in no month
+    valid = ~np.isnat(months)
+    months = months[valid]
+    first_month = months.min() if months.size else np.datetime64('1970-01')
+    month_idx = (months - first_month).astype(np.intp)
+    n_months = month_idx.max() + 1 if month_idx.size else 0
+    fraud = _df['PotentialFraud'].cat
+    n_status = len(fraud.categories)
+    counts, sums = group_totals(
+        month_idx * n_status + fraud.codes.to_numpy()[valid],
+        n_months * n_status,
+        amount=_df['InscClaimAmtReimbursed'].to_numpy()[valid]
+    )
+    seen = counts > 0
+    monthly_trends = pd.DataFrame({
+        'Month': np.repeat((first_month + np.arange(n_months)).astype('datetime64[ns]'), n_status)[seen],
+        'PotentialFraud': pd.Categorical.from_codes(np.tile(np.arange(n_status), n_months)[seen], fraud.categories),
+        'InscClaimAmtReimbursed': sums['amount'][seen].astype('int64'),
+        'Claims': counts[seen].astype('int32')
+    })
+    
+    fig10 = fraud_status_lines(monthly_trends, 'Month', 'InscClaimAmtReimbursed')
+    fig10 = update_chart_layout(fig10, "Monthly Claim Amount Trend")
+    fig10.update_layout(xaxis_title="Month", yaxis_title="Total Claim Amount ($)")
+    
+    fig11 = fraud_status_lines(monthly_trends, 'Month', 'Claims')
+    fig11 = update_chart_layout(fig11, "Monthly Claim Volume Trend")
+    fig11.update_layout(xaxis_title="Month", yaxis_title="Number of Claims")
+    return fig10, fig11
+
+def fit_trend_lines(df, x_col, y_col):
+    """Least-squares fit of y_col on x_col per fraud status, as {status: (slope, intercept, x_min, x_max)}"""
+    trend_lines = {}
+    for status, group in df.groupby('PotentialFraud', observed=True):
+        x = group[x_col].to_numpy()
+        y = group[y_col].to_numpy()
+        if x.min() == x.max():
+            continue
+        slope, intercept = np.polyfit(x, y, 1)
+        trend_lines[status] = (slope, intercept, x.min(), x.max())
+    return trend_lines
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_conditions_vs_amount(filters, _df):
+    """Chronic condition count vs claim amount scatter with a trend line per fraud status"""
+    fig12 = px.scatter(
+        sample_by_fraud_status(_df)[['ChronicConditionCount', 'InscClaimAmtReimbursed', 'PotentialFraud']],
+        x='ChronicConditionCount',
+        y='InscClaimAmtReimbursed',
+        color='PotentialFraud',
+        labels={
+            'ChronicConditionCount': 'Number of Chronic Conditions',
+            'InscClaimAmtReimbursed': 'Claim Amount ($)'
+        },
+        opacity=0.6,
+        color_discrete_map={'Yes': '#e74c3c', 'No': '#2ecc71'},
+        render_mode='webgl'
+    )
+    
+    # Least-squares trend line per fraud status over all filtered rows, drawn as a two-point line
+    trend_lines = fit_trend_lines(_df, 'ChronicConditionCount', 'InscClaimAmtReimbursed')
+    for status, (slope, intercept, x_min, x_max) in trend_lines.items():
+        x_line = np.array([x_min, x_max])
+        fig12.add_trace(go.Scattergl(
+            x=x_line,
+            y=slope * x_line + intercept,
+            mode='lines',
+            line=dict(color='#e74c3c' if status == 'Yes' else '#2ecc71'),
+            legendgroup=status,
+            showlegend=False,
+            hovertemplate=f'{status} trend: y = {slope:.1f}x + {intercept:.1f}<extra></extra>'
+        ))
+    return update_chart_layout(fig12, "Chronic Condition Count vs Claim Amount")
+
+@st.cache_data(show_spinner=False)
+def build_top_conditions(condition_counts):
+    """Top 10 chronic conditions across the dataset; returns the figure and the counts"""
+    top_conditions = condition_counts.head(10).astype('int32').rename_axis('Condition').reset_index(name='Count')
+    
+    # Horizontal bars stack from the bottom, so the descending counts are drawn in reverse
+    # to put the most common condition on top
+    fig13 = px.bar(
+        top_conditions.iloc[::-1],
+        x='Count',
+        y='Condition',
+        orientation='h',
+        color_discrete_sequence=['#722f37']
+    )
+    return update_chart_layout(fig13, "Top 10 Chronic Conditions"), top_conditions
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def compute_condition_stats(filters, _df):
+    """Top 15 condition fraud rates (None if no claim lists a condition) and the condition count/claim amount correlation"""
+    correlation_conditions = np.corrcoef(
+        _df['ChronicConditionCount'].to_numpy(), _df['InscClaimAmtReimbursed'].to_numpy()
+    )[0, 1]
+    
+    # Each claim's fraud flag is repeated once per condition it lists
+    conditions, conditions_per_claim = split_conditions(_df['ChronicConditionList'])
+    if not conditions_per_claim.any():
+        return None, correlation_conditions
+    
+    # Fraud rate per condition as a grouped sum over the factorized condition codes. The
+    # codes follow condition names alphabetically and the stable sort keeps that order among
+    # tied rates, which are common: a single provider's claims all share one fraud label
+    codes, conditions = pd.factorize(conditions, sort=True)
+    counts, sums = group_totals(
+        codes, len(conditions), fraud=np.repeat(_df['_is_fraud'].to_numpy(), conditions_per_claim)
+    )
+    condition_fraud_rate = (
+        pd.Series(sums['fraud'] / counts * 100, index=pd.Index(conditions, name='Condition'))
+        .sort_values(ascending=False, kind='stable').head(15).astype('float32')
+    )
+    return condition_fraud_rate, correlation_conditions
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_condition_fraud_rate(condition_fraud_rate):
+    """Bar chart of the per-condition fraud rates from compute_condition_stats"""
+    # Highest rate last so it is drawn as the top bar
+    condition_fraud_rate = condition_fraud_rate.iloc[::-1]
+    fig14 = px.bar(
+        x=condition_fraud_rate.values,
+        y=condition_fraud_rate.index,
+        labels={'x': 'Fraud Rate (%)', 'y': 'Condition'},
+        orientation='h',
+        color_discrete_sequence=['#722f37']
+    )
+    return update_chart_layout(fig14, "Conditions with Highest Fraud Rate")
+
+def condition_section(filters, df_filtered, condition_counts):
+    """Medical Analysis view: condition charts and their insights"""
+    st.markdown('<h2 class="sub-header">Medical Conditions Analysis</h2>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    condition_fraud_rate, correlation_conditions = compute_condition_stats(filters, df_filtered)
+    
+    with col1:
+        # Graph: Chronic Condition Count vs Claim Amount
+        fig12 = build_conditions_vs_amount(filters, df_filtered)
+        st.plotly_chart(fig12, use_container_width=True, key='conditions_vs_amount')
+        
+        # Add insights
+        add_graph_insights(
+            "Chronic Conditions Impact",
+            f"• Correlation between conditions and claim amount: {correlation_conditions:.2f}<br>• Patients with more conditions typically have higher claims"
+        )
+    
+    with col2:
+        # Graph: Frequency of Chronic Conditions
+        fig13, top_conditions = build_top_conditions(condition_counts)
+        st.plotly_chart(fig13, use_container_width=True, key='top_conditions')
+        
+        # Add insights
+        top_condition = top_conditions['Condition'].iat[0] if not top_conditions.empty else "N/A"
+        top_condition_count = top_conditions['Count'].iat[0] if not top_conditions.empty else 0
+        add_graph_insights(
+            "Common Conditions Analysis",
+            f"• Most common condition: {top_condition} ({top_condition_count:,} occurrences)<br>• Understanding prevalent conditions helps with resource allocation"
+        )
+    
+    # Condition analysis by fraud status
+    st.markdown("Condition Patterns by Fraud Status")
+    if condition_fraud_rate is not None:
+        fig14 = build_condition_fraud_rate(condition_fraud_rate)
+        st.plotly_chart(fig14, use_container_width=True, key='condition_fraud_rate')
+        
+        # Add insights
+        if not condition_fraud_rate.empty:
+            high_risk_condition = condition_fraud_rate.index[0]
+            high_risk_rate = condition_fraud_rate.iat[0]
+            add_graph_insights(
+                "High-Risk Condition Analysis",
+                f"• Highest fraud rate: {high_risk_condition} ({high_risk_rate:.1f}%)<br>• Conditions with high fraud rates require focused review"
+            )
+
 # Create dashboard
 def main():
     # Header with updated styling
     st.markdown('<h1 class="main-header">Healthcare Fraud Detection Dashboard</h1>', unsafe_allow_html=True)
     
     # Load data
-    df, all_conditions = load_data()
+    df, condition_counts, all_claim_types = load_data()
     
     # Sidebar filters
     with st.sidebar:
@@ -248,20 +552,17 @@ def main():
         
         if len(date_range) == 2:
             start_date, end_date = pd.to_datetime(date_range[0]), pd.to_datetime(date_range[1])
-            df_filtered = df[(df['AttendingDate'] >= start_date) & (df['AttendingDate'] <= end_date)]
         else:
-            df_filtered = df
+            start_date = end_date = None
         
         # Provider filter
-        all_providers = ['All Providers'] + sorted(df_filtered['Provider'].unique().tolist())
+        all_providers = ['All Providers'] + providers_for_range(df, start_date, end_date)
         selected_provider = st.selectbox(
             "Select Provider:",
             all_providers,
             help="Choose a specific provider or view all"
         )
-        
-        if selected_provider != 'All Providers':
-            df_filtered = df_filtered[df_filtered['Provider'] == selected_provider]
+        provider = selected_provider if selected_provider != 'All Providers' else None
         
         # Fraud status filter
         fraud_status = st.multiselect(
@@ -272,19 +573,20 @@ def main():
         
         if 'All Claims' not in fraud_status:
             fraud_mapping = {'Potential Fraud': 'Yes', 'No Fraud': 'No'}
-            selected_status = [fraud_mapping[status] for status in fraud_status if status in fraud_mapping]
-            df_filtered = df_filtered[df_filtered['PotentialFraud'].isin(selected_status)]
+            selected_status = tuple(fraud_mapping[status] for status in fraud_status if status in fraud_mapping)
+        else:
+            selected_status = None
         
         # Claim type filter
         claim_types = st.multiselect(
             "Filter by Claim Type:",
-            options=df_filtered['ClaimType'].unique().tolist(),
-            default=df_filtered['ClaimType'].unique().tolist(),
+            options=all_claim_types,
+            default=all_claim_types,
             help="Select one or more claim types"
         )
         
-        if claim_types:
-            df_filtered = df_filtered[df_filtered['ClaimType'].isin(claim_types)]
+        filters = (start_date, end_date, provider, selected_status, tuple(claim_types))
+        df_filtered = apply_filters(df, *filters)
         
         st.markdown("---")
         
@@ -321,10 +623,18 @@ def main():
     # Main content area
     # Top metrics with custom cards
     st.markdown('<h2 class="sub-header">Key Performance Indicators</h2>', unsafe_allow_html=True)
+    
+    # One vectorized reduction feeds all four cards
+    kpis = df_filtered[['_is_fraud', 'InscClaimAmtReimbursed', 'LengthOfStay']].agg(['sum', 'mean'])
+    total_claims = len(df_filtered)
+    fraud_count = int(kpis.at['sum', '_is_fraud'])
+    fraud_percentage = kpis.at['mean', '_is_fraud'] * 100
+    avg_claim_amount = kpis.at['mean', 'InscClaimAmtReimbursed']
+    avg_length_of_stay = kpis.at['mean', 'LengthOfStay']
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_claims = len(df_filtered)
         st.markdown(f"""
         <div class="metric-card">
             <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">Total Claims</div>
@@ -333,8 +643,6 @@ def main():
         """, unsafe_allow_html=True)
     
     with col2:
-        fraud_count = len(df_filtered[df_filtered['PotentialFraud'] == 'Yes'])
-        fraud_percentage = (fraud_count / total_claims * 100) if total_claims > 0 else 0
         st.markdown(f"""
         <div class="metric-card">
             <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">Fraud Cases</div>
@@ -344,7 +652,6 @@ def main():
         """, unsafe_allow_html=True)
     
     with col3:
-        avg_claim_amount = df_filtered['InscClaimAmtReimbursed'].mean()
         st.markdown(f"""
         <div class="metric-card">
             <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">Avg Claim Amount</div>
@@ -353,7 +660,6 @@ def main():
         """, unsafe_allow_html=True)
     
     with col4:
-        avg_length_of_stay = df_filtered['LengthOfStay'].mean()
         st.markdown(f"""
         <div class="metric-card">
             <div style="font-size: 0.9rem; color: #666; margin-bottom: 5px;">Avg Length of Stay</div>
@@ -361,35 +667,30 @@ def main():
         </div>
         """, unsafe_allow_html=True)
     
-    # Main content tabs 
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "Overview Dashboard", 
-        "Financial Analysis", 
-        "Provider Insights", 
-        "Temporal Trends", 
-        "Medical Analysis"
-    ])
+    # Main content views; only the selected one is computed and rendered on each rerun
+    view = st.radio(
+        "Dashboard view",
+        [
+            "Overview Dashboard", 
+            "Financial Analysis", 
+            "Provider Insights", 
+            "Temporal Trends", 
+            "Medical Analysis"
+        ],
+        horizontal=True,
+        label_visibility='collapsed',
+        key='active_view'
+    )
     
-    with tab1:
+    if view == "Overview Dashboard":
         st.markdown('<h2 class="sub-header">Comprehensive Data Overview</h2>', unsafe_allow_html=True)
         
         col1, col2 = st.columns(2)
         
         with col1:
             # Fraud distribution pie chart
-            fraud_dist = df_filtered['PotentialFraud'].value_counts()
-            colors = ['#e74c3c' if x == 'Yes' else '#2ecc71' for x in fraud_dist.index]
-            
-            fig1 = go.Figure(data=[go.Pie(
-                labels=['Potential Fraud' if x == 'Yes' else 'No Fraud' for x in fraud_dist.index],
-                values=fraud_dist.values,
-                hole=0.3,
-                marker_colors=colors,
-                textinfo='percent+label',
-                textfont=dict(family='Poppins', size=14, color='black')
-            )])
-            fig1 = update_chart_layout(fig1, 'Fraud Distribution Analysis')
-            st.plotly_chart(fig1, use_container_width=True)
+            fig1 = build_fraud_distribution(filters, df_filtered)
+            st.plotly_chart(fig1, use_container_width=True, key='fraud_dist')
             
             # Add insights
             add_graph_insights(
@@ -401,21 +702,12 @@ def main():
         
         with col2:
             # Claim type distribution 
-            claim_dist = df_filtered['ClaimType'].value_counts()
-            fig2 = px.bar(
-                x=claim_dist.index,
-                y=claim_dist.values,
-                labels={'x': 'Claim Type', 'y': 'Number of Claims'},
-                color=claim_dist.values,
-                color_continuous_scale=['#f8d7da', '#dc3545', '#722f37']
-            )
-            fig2 = update_chart_layout(fig2, "Claim Type Distribution")
-            fig2.update_xaxes(tickangle=45)
-            st.plotly_chart(fig2, use_container_width=True)
+            fig2, claim_dist = build_claim_type_distribution(filters, df_filtered)
+            st.plotly_chart(fig2, use_container_width=True, key='claim_type_dist')
             
             # Add insights
             top_claim_type = claim_dist.index[0]
-            top_claim_count = claim_dist.iloc[0]
+            top_claim_count = claim_dist.iat[0]
             add_graph_insights(
                 "Claim Type Analysis",
                 f"• {top_claim_type} claims are most frequent ({top_claim_count:,})<br>• Distribution helps identify service patterns"
@@ -425,14 +717,8 @@ def main():
         col3, col4 = st.columns(2)
         
         with col3:
-            gender_dist = df_filtered['Gender'].value_counts()
-            fig3 = px.pie(
-                values=gender_dist.values,
-                names=gender_dist.index,
-                color_discrete_sequence=['#722f37', '#f8d7da']
-            )
-            fig3 = update_chart_layout(fig3, "Gender Distribution")
-            st.plotly_chart(fig3, use_container_width=True)
+            fig3, gender_dist = build_gender_distribution(filters, df_filtered)
+            st.plotly_chart(fig3, use_container_width=True, key='gender_dist')
             
             # Add insights
             gender_ratio = (gender_dist.get('Male', 0) / gender_dist.sum() * 100) if gender_dist.sum() > 0 else 0
@@ -442,50 +728,34 @@ def main():
             )
         
         with col4:
-            race_dist = df_filtered['Race'].value_counts()
-            fig4 = px.bar(
-                x=race_dist.index,
-                y=race_dist.values,
-                labels={'x': 'Race', 'y': 'Count'},
-                color=race_dist.values,
-                color_continuous_scale=['#f8d7da', '#722f37']
-            )
-            fig4 = update_chart_layout(fig4, "Race Distribution")
-            st.plotly_chart(fig4, use_container_width=True)
+            fig4, race_dist = build_race_distribution(filters, df_filtered)
+            st.plotly_chart(fig4, use_container_width=True, key='race_dist')
             
             # Add insights
             dominant_race = race_dist.index[0]
-            dominant_count = race_dist.iloc[0]
+            dominant_count = race_dist.iat[0]
             add_graph_insights(
                 "Race Distribution Insights",
                 f"• {dominant_race} represents largest demographic group<br>• Understanding demographic patterns aids in fraud detection"
             )
     
-    with tab2:
+    elif view == "Financial Analysis":
         st.markdown('<h2 class="sub-header">Financial Claims Analysis</h2>', unsafe_allow_html=True)
         
         col1, col2 = st.columns(2)
         
         with col1:
             # Graph 1: Claim Amount Distribution (Box Plot)
-            fig5 = px.box(
-                df_filtered,
-                x='ClaimType',
-                y='InscClaimAmtReimbursed',
-                color='PotentialFraud',
-                labels={'InscClaimAmtReimbursed': 'Claim Amount ($)', 'ClaimType': 'Claim Type'},
-                color_discrete_map={'Yes': '#e74c3c', 'No': '#2ecc71'}
-            )
-            fig5 = update_chart_layout(fig5, "Claim Amount Distribution by Type")
-            st.plotly_chart(fig5, use_container_width=True)
+            fig5 = build_claim_amount_box(filters, df_filtered)
+            st.plotly_chart(fig5, use_container_width=True, key='claim_amount_box')
             
             # Add insights
-            fraud_claims = df_filtered[df_filtered['PotentialFraud'] == 'Yes']
-            no_fraud_claims = df_filtered[df_filtered['PotentialFraud'] == 'No']
+            is_fraud = df_filtered['_is_fraud'].to_numpy().astype(bool)
+            amounts = df_filtered['InscClaimAmtReimbursed'].to_numpy()
             
-            if not fraud_claims.empty and not no_fraud_claims.empty:
-                avg_fraud_amount = fraud_claims['InscClaimAmtReimbursed'].mean()
-                avg_no_fraud_amount = no_fraud_claims['InscClaimAmtReimbursed'].mean()
+            if is_fraud.any() and not is_fraud.all():
+                avg_fraud_amount = amounts[is_fraud].mean()
+                avg_no_fraud_amount = amounts[~is_fraud].mean()
                 diff_percentage = ((avg_fraud_amount - avg_no_fraud_amount) / avg_no_fraud_amount * 100) if avg_no_fraud_amount > 0 else 0
                 
                 add_graph_insights(
@@ -495,25 +765,12 @@ def main():
         
         with col2:
             # Graph 2: Average Claim Amount by Provider (Top 15)
-            provider_avg = df_filtered.groupby(['Provider', 'PotentialFraud'])['InscClaimAmtReimbursed'].mean().reset_index()
-            provider_avg = provider_avg.sort_values('InscClaimAmtReimbursed', ascending=False).head(15)
-            
-            fig6 = px.bar(
-                provider_avg,
-                y='Provider',
-                x='InscClaimAmtReimbursed',
-                color='PotentialFraud',
-                labels={'InscClaimAmtReimbursed': 'Average Claim Amount ($)', 'Provider': 'Provider'},
-                orientation='h',
-                color_discrete_map={'Yes': '#e74c3c', 'No': '#2ecc71'}
-            )
-            fig6 = update_chart_layout(fig6, "Top 15 Providers by Avg Claim Amount")
-            fig6.update_layout(yaxis={'categoryorder': 'total ascending'})
-            st.plotly_chart(fig6, use_container_width=True)
+            fig6, provider_avg = build_provider_avg_claim(filters, df_filtered)
+            st.plotly_chart(fig6, use_container_width=True, key='provider_avg_claim')
             
             # Add insights
-            top_provider = provider_avg.iloc[0]['Provider'] if not provider_avg.empty else "N/A"
-            top_amount = provider_avg.iloc[0]['InscClaimAmtReimbursed'] if not provider_avg.empty else 0
+            top_provider = provider_avg['Provider'].iat[0] if not provider_avg.empty else "N/A"
+            top_amount = provider_avg['InscClaimAmtReimbursed'].iat[0] if not provider_avg.empty else 0
             add_graph_insights(
                 "Provider Financial Insights",
                 f"• Top provider by claim amount: {top_provider} (${top_amount:,.0f})<br>• High-value providers should be monitored closely"
@@ -524,22 +781,13 @@ def main():
         inpatient_data = df_filtered[df_filtered['ClaimType'] == 'Inpatient']
         
         if not inpatient_data.empty:
-            fig7 = px.scatter(
-                inpatient_data,
-                x='LengthOfStay',
-                y='InscClaimAmtReimbursed',
-                color='PotentialFraud',
-                labels={'LengthOfStay': 'Length of Stay (days)', 'InscClaimAmtReimbursed': 'Claim Amount ($)'},
-                opacity=0.7,
-                color_discrete_map={'Yes': '#e74c3c', 'No': '#2ecc71'},
-                size_max=15
-            )
-            fig7 = update_chart_layout(fig7, "Length of Stay vs Claim Amount (Inpatient)")
-            fig7.update_traces(marker=dict(size=8))
-            st.plotly_chart(fig7, use_container_width=True)
+            fig7 = build_stay_vs_amount(filters, inpatient_data)
+            st.plotly_chart(fig7, use_container_width=True, key='stay_vs_amount')
             
             # Add insights
-            correlation = inpatient_data[['LengthOfStay', 'InscClaimAmtReimbursed']].corr().iloc[0,1]
+            correlation = np.corrcoef(
+                inpatient_data['LengthOfStay'].to_numpy(), inpatient_data['InscClaimAmtReimbursed'].to_numpy()
+            )[0, 1]
             add_graph_insights(
                 "Inpatient Stay Analysis",
                 f"• Correlation between stay length and claim amount: {correlation:.2f}<br>• Longer stays typically associated with higher costs"
@@ -547,26 +795,12 @@ def main():
         else:
             st.info("No inpatient claims found with the current filters.")
     
-    with tab3:
+    elif view == "Provider Insights":
         st.markdown('<h2 class="sub-header">Provider Performance & Risk Assessment</h2>', unsafe_allow_html=True)
         
         # Graph 4: Inpatient vs Outpatient Ratio per Provider (Top 10)
-        claim_type_by_provider = df_filtered.groupby(['Provider', 'ClaimType']).size().unstack(fill_value=0)
-        claim_type_by_provider['Total'] = claim_type_by_provider.sum(axis=1)
-        top_providers = claim_type_by_provider.nlargest(10, 'Total').drop('Total', axis=1)
-        
-        fig8 = px.bar(
-            top_providers.reset_index().melt(id_vars='Provider', var_name='ClaimType', value_name='Count'),
-            x='Provider',
-            y='Count',
-            color='ClaimType',
-            title="Claim Type Distribution by Provider (Top 10)",
-            barmode='stack',
-            color_discrete_sequence=['#722f37', '#e74c3c', '#2ecc71']
-        )
-        fig8 = update_chart_layout(fig8, "Claim Type Distribution by Provider (Top 10)")
-        fig8.update_layout(xaxis={'categoryorder': 'total descending'})
-        st.plotly_chart(fig8, use_container_width=True)
+        fig8 = build_provider_claim_mix(filters, df_filtered)
+        st.plotly_chart(fig8, use_container_width=True, key='provider_claim_mix')
         
         # Add insights
         add_graph_insights(
@@ -578,21 +812,19 @@ def main():
         st.markdown("Provider Risk Assessment Matrix")
         
         # Calculate fraud indicators
-        provider_stats = df_filtered.groupby('Provider').agg({
-            'PotentialFraud': lambda x: (x == 'Yes').mean() * 100,
-            'InscClaimAmtReimbursed': ['mean', 'sum', 'count'],
-            'LengthOfStay': 'mean'
-        }).round(2)
-        
-        provider_stats.columns = ['Fraud_Rate_%', 'Avg_Claim_$', 'Total_Claims_$', 'Claim_Count', 'Avg_LOS_days']
-        provider_stats = provider_stats.sort_values('Fraud_Rate_%', ascending=False)
+        provider_stats = compute_provider_stats(filters, df_filtered)
         
-        # Apply conditional formatting to the dataframe
-        def color_fraud_rate(val):
-            color = '#e74c3c' if val > 30 else ('#f39c12' if val > 15 else '#2ecc71')
-            return f'color: {color}; font-weight: bold;'
+        # Apply conditional formatting to the dataframe (>30% red, >15% orange, else green),
+        # binning the whole column at once instead of calling a function per cell
+        top_provider_stats = provider_stats.head(15)
+        fraud_rate_colors = pd.cut(
+            top_provider_stats['Fraud_Rate_%'],
+            bins=[-np.inf, 15, 30, np.inf],
+            labels=['#2ecc71', '#f39c12', '#e74c3c']
+        ).astype(str)
+        fraud_rate_styles = 'color: ' + fraud_rate_colors + '; font-weight: bold;'
         
-        styled_df = provider_stats.head(15).style.map(color_fraud_rate, subset=['Fraud_Rate_%'])
+        styled_df = top_provider_stats.style.apply(lambda col: fraud_rate_styles, subset=['Fraud_Rate_%'])
         
         st.dataframe(
             styled_df,
@@ -606,58 +838,32 @@ def main():
             "• High fraud rate providers (>30%): Red flag for investigation<br>• Moderate risk (15-30%): Enhanced monitoring recommended"
         )
     
-    with tab4:
+    elif view == "Temporal Trends":
         st.markdown('<h2 class="sub-header">Temporal Trends & Patterns</h2>', unsafe_allow_html=True)
         
         # Graph 5: Claim Volume Over Time
-        claims_over_time = df_filtered.groupby(['ClaimYear', 'PotentialFraud']).size().reset_index(name='Count')
-        
-        fig9 = px.line(
-            claims_over_time,
-            x='ClaimYear',
-            y='Count',
-            color='PotentialFraud',
-            markers=True,
-            color_discrete_map={'Yes': '#e74c3c', 'No': '#2ecc71'},
-            line_shape='spline'
-        )
-        fig9 = update_chart_layout(fig9, "Claim Volume Over Time")
-        fig9.update_layout(xaxis_title="Year", yaxis_title="Number of Claims")
-        st.plotly_chart(fig9, use_container_width=True)
+        fig9, claims_over_time = build_claims_over_time(filters, df_filtered)
+        st.plotly_chart(fig9, use_container_width=True, key='claims_over_time')
         
         # Add insights
-        if not claims_over_time.empty:
-            fraud_trend = claims_over_time[claims_over_time['PotentialFraud'] == 'Yes']
-            if not fraud_trend.empty:
-                latest_year = fraud_trend['ClaimYear'].max()
-                latest_count = fraud_trend[fraud_trend['ClaimYear'] == latest_year]['Count'].iloc[0] if not fraud_trend[fraud_trend['ClaimYear'] == latest_year].empty else 0
-                add_graph_insights(
-                    "Temporal Trend Analysis",
-                    f"• Latest year ({latest_year}) fraud cases: {latest_count:,}<br>• Monitor for seasonal or yearly patterns in fraud detection"
-                )
+        fraud_trend = claims_over_time[claims_over_time['PotentialFraud'] == 'Yes']
+        fraud_by_year = dict(zip(fraud_trend['ClaimYear'], fraud_trend['Count']))
+        if fraud_by_year:
+            latest_year = max(fraud_by_year)
+            latest_count = fraud_by_year[latest_year]
+            add_graph_insights(
+                "Temporal Trend Analysis",
+                f"• Latest year ({latest_year}) fraud cases: {latest_count:,}<br>• Monitor for seasonal or yearly patterns in fraud detection"
+            )
         
         # Monthly trends
         st.markdown("Monthly Trends Analysis")
-        df_filtered['Month'] = df_filtered['AttendingDate'].dt.to_period('M').astype(str)
-        monthly_trends = df_filtered.groupby(['Month', 'PotentialFraud']).agg({
-            'InscClaimAmtReimbursed': 'sum',
-            'ClaimID': 'count'
-        }).reset_index()
+        fig10, fig11 = build_monthly_trends(filters, df_filtered)
         
         col1, col2 = st.columns(2)
         
         with col1:
-            fig10 = px.line(
-                monthly_trends,
-                x='Month',
-                y='InscClaimAmtReimbursed',
-                color='PotentialFraud',
-                color_discrete_map={'Yes': '#e74c3c', 'No': '#2ecc71'},
-                line_shape='spline'
-            )
-            fig10 = update_chart_layout(fig10, "Monthly Claim Amount Trend")
-            fig10.update_layout(xaxis_title="Month", yaxis_title="Total Claim Amount ($)")
-            st.plotly_chart(fig10, use_container_width=True)
+            st.plotly_chart(fig10, use_container_width=True, key='monthly_amount')
             
             # Add insights
             add_graph_insights(
@@ -666,17 +872,7 @@ def main():
             )
         
         with col2:
-            fig11 = px.line(
-                monthly_trends,
-                x='Month',
-                y='ClaimID',
-                color='PotentialFraud',
-                color_discrete_map={'Yes': '#e74c3c', 'No': '#2ecc71'},
-                line_shape='spline'
-            )
-            fig11 = update_chart_layout(fig11, "Monthly Claim Volume Trend")
-            fig11.update_layout(xaxis_title="Month", yaxis_title="Number of Claims")
-            st.plotly_chart(fig11, use_container_width=True)
+            st.plotly_chart(fig11, use_container_width=True, key='monthly_volume')
             
             # Add insights
             add_graph_insights(
@@ -684,103 +880,8 @@ def main():
                 "• Monitor for unusual claim volume patterns<br>• Consistent fraud volume may indicate systemic issues"
             )
     
-    with tab5:
-        st.markdown('<h2 class="sub-header">Medical Conditions Analysis</h2>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Graph: Chronic Condition Count vs Claim Amount
-            fig12 = px.scatter(
-                df_filtered,
-                x='ChronicConditionCount',
-                y='InscClaimAmtReimbursed',
-                color='PotentialFraud',
-                labels={
-                    'ChronicConditionCount': 'Number of Chronic Conditions',
-                    'InscClaimAmtReimbursed': 'Claim Amount ($)'
-                },
-                opacity=0.6,
-                color_discrete_map={'Yes': '#e74c3c', 'No': '#2ecc71'},
-                trendline="ols"
-            )
-            fig12 = update_chart_layout(fig12, "Chronic Condition Count vs Claim Amount")
-            st.plotly_chart(fig12, use_container_width=True)
-            
-            # Add insights
-            correlation_conditions = df_filtered[['ChronicConditionCount', 'InscClaimAmtReimbursed']].corr().iloc[0,1]
-            add_graph_insights(
-                "Chronic Conditions Impact",
-                f"• Correlation between conditions and claim amount: {correlation_conditions:.2f}<br>• Patients with more conditions typically have higher claims"
-            )
-        
-        with col2:
-            # Graph: Frequency of Chronic Conditions
-            from collections import Counter
-            condition_counts = Counter(all_conditions)
-            top_conditions = pd.DataFrame(condition_counts.most_common(10), columns=['Condition', 'Count'])
-            
-            fig13 = px.bar(
-                top_conditions,
-                x='Count',
-                y='Condition',
-                orientation='h',
-                color='Count',
-                color_continuous_scale=['#f8d7da', '#722f37']
-            )
-            fig13 = update_chart_layout(fig13, "Top 10 Chronic Conditions")
-            fig13.update_layout(yaxis={'categoryorder': 'total ascending'})
-            st.plotly_chart(fig13, use_container_width=True)
-            
-            # Add insights
-            top_condition = top_conditions.iloc[0]['Condition'] if not top_conditions.empty else "N/A"
-            top_condition_count = top_conditions.iloc[0]['Count'] if not top_conditions.empty else 0
-            add_graph_insights(
-                "Common Conditions Analysis",
-                f"• Most common condition: {top_condition} ({top_condition_count:,} occurrences)<br>• Understanding prevalent conditions helps with resource allocation"
-            )
-        
-        # Condition analysis by fraud status
-        st.markdown("Condition Patterns by Fraud Status")
-        
-        # Extract conditions and create a matrix
-        condition_data = []
-        for idx, row in df_filtered.iterrows():
-            if pd.notna(row['ChronicConditionList']):
-                conditions = row['ChronicConditionList'].split(',')
-                for condition in conditions:
-                    condition_data.append({
-                        'Condition': condition.strip(),
-                        'PotentialFraud': row['PotentialFraud'],
-                        'Provider': row['Provider']
-                    })
-        
-        if condition_data:
-            condition_df = pd.DataFrame(condition_data)
-            condition_fraud_rate = condition_df.groupby('Condition')['PotentialFraud'].apply(
-                lambda x: (x == 'Yes').mean() * 100
-            ).sort_values(ascending=False).head(15)
-            
-            fig14 = px.bar(
-                x=condition_fraud_rate.values,
-                y=condition_fraud_rate.index,
-                labels={'x': 'Fraud Rate (%)', 'y': 'Condition'},
-                orientation='h',
-                color=condition_fraud_rate.values,
-                color_continuous_scale='Reds'
-            )
-            fig14 = update_chart_layout(fig14, "Conditions with Highest Fraud Rate")
-            st.plotly_chart(fig14, use_container_width=True)
-            
-            # Add insights
-            if not condition_fraud_rate.empty:
-                high_risk_condition = condition_fraud_rate.index[0]
-                high_risk_rate = condition_fraud_rate.iloc[0]
-                add_graph_insights(
-                    "High-Risk Condition Analysis",
-                    f"• Highest fraud rate: {high_risk_condition} ({high_risk_rate:.1f}%)<br>• Conditions with high fraud rates require focused review"
-                )
-
+    elif view == "Medical Analysis":
+        condition_section(filters, df_filtered, condition_counts)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,36 @@
+import importlib
+import os
+import sys
+import unittest
+
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class MonthlyTrendsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The dashboard reads style.css and the Parquet file relative to the repo root
+        os.chdir(REPO_ROOT)
+        sys.path.insert(0, REPO_ROOT)
+        cls.dashboard = importlib.import_module('fraud_dashboard')
+        cls.df, _, _ = cls.dashboard.load_data()
+
+    def monthly_volume(self, df, key):
+        _, fig11 = self.dashboard.build_monthly_trends(key, df)
+        return sum(trace.y.sum() for trace in fig11.data)
+
+    def test_nat_dates_are_left_out(self):
+        df = self.df.iloc[:1000].copy()
+        df.loc[df.index[5], 'AttendingDate'] = pd.NaT
+        self.assertEqual(self.monthly_volume(df, ('one NaT',)), len(df) - 1)
+
+    def test_all_nat_dates_give_empty_trends(self):
+        df = self.df.iloc[:1000].copy()
+        df['AttendingDate'] = pd.NaT
+        self.assertEqual(self.monthly_volume(df, ('all NaT',)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()